@@ -0,0 +1,58 @@
+# bash completion for gmaps.py, generated by: gmaps.py --generate-completion bash
+_gmaps() {
+    local cur=${COMP_WORDS[COMP_CWORD]} prev=${COMP_WORDS[COMP_CWORD-1]}
+    local words
+    if (( COMP_CWORD == 1 )); then
+        words="geocode reverse-geocode directions distance-matrix places-search places-nearby place-details autocomplete place-photo elevation timezone air-quality air-quality-history air-quality-forecast pollen solar solar-layers weather validate-address snap-roads nearest-roads streetview static-map geolocation aerial-view route-optimize places-aggregate embed-url daemon -h --help --version"
+    else
+        case "${COMP_WORDS[1]} $prev" in
+            "directions --mode") words="driving walking bicycling transit two_wheeler" ;;
+            "directions --units") words="metric imperial" ;;
+            "solar --quality") words="LOW MEDIUM HIGH" ;;
+            "solar-layers --quality") words="LOW MEDIUM HIGH" ;;
+            "weather --mode") words="current hourly daily history" ;;
+            "static-map --maptype") words="roadmap satellite terrain hybrid" ;;
+            "static-map --format") words="png jpg gif" ;;
+            "static-map --scale") words="1 2 4" ;;
+            "aerial-view aerial-view") words="check render get" ;;
+            "places-aggregate --insight") words="INSIGHT_COUNT INSIGHT_PLACES" ;;
+            "embed-url --mode") words="place directions search view streetview" ;;
+            "daemon daemon") words="start stop run" ;;
+        esac
+        if [[ -z $words && $cur == -* ]]; then
+            case "${COMP_WORDS[1]}" in
+                geocode) words="-h --batch --bounds --region --components --language" ;;
+                reverse-geocode) words="-h --batch --result-type --location-type --language" ;;
+                directions) words="-h --mode --alternatives --avoid-tolls --avoid-highways --avoid-ferries --waypoints --departure-time --units --language --decode" ;;
+                distance-matrix) words="-h --origins --destinations --mode" ;;
+                places-search) words="-h --location --radius --type --min-rating --open-now --language --max-results --fields" ;;
+                places-nearby) words="-h --radius --type --language --max-results --fields" ;;
+                place-details) words="-h --fields" ;;
+                autocomplete) words="-h --location --radius --language --region --types" ;;
+                place-photo) words="-h --max-height --max-width" ;;
+                elevation) words="-h --locations --path --samples --batch" ;;
+                timezone) words="-h --batch --timestamp --language" ;;
+                air-quality) words="-h --health --pollutants --language" ;;
+                air-quality-history) words="-h --hours --language" ;;
+                air-quality-forecast) words="-h --language" ;;
+                pollen) words="-h --days --language" ;;
+                solar) words="-h --quality" ;;
+                solar-layers) words="-h --radius --quality --pixel-size" ;;
+                weather) words="-h --mode --hours --days --language" ;;
+                validate-address) words="-h --region --locality --enable-usps" ;;
+                snap-roads) words="-h --interpolate --decode" ;;
+                nearest-roads) words="-h" ;;
+                streetview) words="-h --lat --lng --location --pano --size --heading --pitch --fov --output" ;;
+                static-map) words="-h --lat --lng --center --zoom --size --maptype --format --markers --path-line --style --scale --output" ;;
+                geolocation) words="-h --wifi --cell --wifi-file --cell-file --consider-ip" ;;
+                aerial-view) words="-h --address --video-id" ;;
+                route-optimize) words="-h --project" ;;
+                places-aggregate) words="-h --location --radius --type --min-rating --price-levels --insight" ;;
+                embed-url) words="-h --mode --query --origin --destination --waypoints-str --lat --lng --center --location --zoom --heading" ;;
+                daemon) words="-h" ;;
+            esac
+        fi
+    fi
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}
+complete -o default -F _gmaps gmaps.py gmaps
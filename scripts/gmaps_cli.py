@@ -0,0 +1,1991 @@
+#!/usr/bin/env python3
+"""Google Maps Platform - Universal API Client
+
+Supports 20+ Google Maps Platform REST APIs from a single CLI.
+Reads GOOGLE_MAPS_API_KEY from environment or .env file.
+
+Usage: gmaps.py <command> [options]
+
+Implementation module for the gmaps.py launcher.
+"""
+
+import atexit
+import functools
+import json
+import os
+import re
+import sys
+import threading
+import time
+import types
+import urllib.parse
+from pathlib import Path
+
+# Heavier modules (http.client alone costs ~20ms to import) are imported
+# where they are first needed, so offline commands such as embed-url and
+# --help output, or runs without --batch or the cache, don't load them.
+# argparse is one of them: it is only needed when parse_fast() gives up.
+
+VERSION = "1.0.0"
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is the fallback
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=_OPTS).decode()
+
+    def _encode(obj):
+        return orjson.dumps(obj)
+
+    def _print_json(obj):
+        # orjson already yields UTF-8 bytes; skip the str round trip.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(obj, option=_OPTS | orjson.OPT_APPEND_NEWLINE))
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    def _encode(obj):
+        return json.dumps(obj).encode()
+
+    def _print_json(obj):
+        json.dump(obj, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+
+
+def _pretty_json(raw):
+    """Indent a JSON body for display; non-JSON bodies are returned as text."""
+    try:
+        return _dumps(_loads(raw))
+    except ValueError:
+        return raw.decode(errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+def _env_paths():
+    return (
+        Path.cwd() / ".env",
+        Path.home() / ".env",
+        Path(__file__).resolve().parent.parent / ".env",
+        Path(__file__).resolve().parent / ".env",
+    )
+
+
+_ENV_PATHS = _env_paths()
+# NAME=value lines; quotes and trailing comments are not part of the value.
+_ENV_RE = re.compile(rb'(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["\']?([^"\'#\r\n]*)')
+
+
+@functools.lru_cache(maxsize=None)
+def load_api_key():
+    """Load API key from env var or .env files.
+
+    The result is cached, so the .env files are read at most once per process.
+    """
+    key = os.environ.get("GOOGLE_MAPS_API_KEY")
+    if key:
+        return key
+
+    for p in _ENV_PATHS:
+        if p.exists():
+            env = dict(_ENV_RE.findall(p.read_bytes()))
+            v = env.get(b"GOOGLE_MAPS_API_KEY", b"").strip()
+            if v:
+                return v.decode()
+
+    print("Error: GOOGLE_MAPS_API_KEY not found.", file=sys.stderr)
+    print("Set it in a .env file or as an environment variable.", file=sys.stderr)
+    sys.exit(1)
+
+
+_API_KEY = None
+_KEY_QS = None
+
+
+def _key():
+    """Return the API key, loading it (and its "key=" query) on first use."""
+    global _API_KEY, _KEY_QS
+    if _API_KEY is None:
+        key = load_api_key()
+        _KEY_QS = "key=" + urllib.parse.quote_plus(key)
+        _API_KEY = key  # set last: other threads test _API_KEY, then read _KEY_QS
+    return _API_KEY
+
+
+# ---------------------------------------------------------------------------
+# HTTP helpers
+# ---------------------------------------------------------------------------
+
+# GMAPS_RAW_ERRORS=1 prints API error bodies exactly as received.
+_RAW_ERRORS = bool(os.environ.get("GMAPS_RAW_ERRORS"))
+
+# I/O chunk size (http.client defaults to 8 KiB): used for request bodies
+# and for streaming downloads to disk, where reads this large bypass the
+# response's internal buffer and go straight to recv().
+_BLOCKSIZE = 64 * 1024
+
+# Persistent HTTPS connections keyed by (thread, host), so repeated calls to
+# the same API reuse the socket (and TLS session) instead of reconnecting every
+# time. Connections are never shared between threads (see --batch).
+_POOL = {}
+_POOL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context():
+    """One shared context, so TLS sessions can be resumed across connections."""
+    import ssl
+    ctx = ssl.create_default_context()
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    return ctx
+
+
+def _get_conn(host, fresh=False):
+    """Return this thread's pooled connection for host, replacing it if fresh."""
+    import http.client
+    slot = (threading.get_ident(), host)
+    with _POOL_LOCK:
+        conn = _POOL.get(slot)
+        if conn is None or fresh:
+            if conn is not None:
+                conn.close()
+            conn = _POOL[slot] = http.client.HTTPSConnection(
+                host, context=_ssl_context(), blocksize=_BLOCKSIZE)
+        return conn
+
+
+@atexit.register
+def _close_pool():
+    with _POOL_LOCK:
+        for conn in _POOL.values():
+            conn.close()
+        _POOL.clear()
+
+
+def _prune_pool():
+    """Close connections whose threads have exited (e.g. --batch workers)."""
+    live = {t.ident for t in threading.enumerate()}
+    with _POOL_LOCK:
+        for slot in [slot for slot in _POOL if slot[0] not in live]:
+            _POOL.pop(slot).close()
+
+
+def _send(method, url, body=None, headers=None):
+    """Send a request over the pool and return the (unread) response.
+
+    A kept-alive socket may have been closed by the server since the last
+    call; in that case reconnect once and retry.
+    """
+    import http.client
+    # URLs here are always absolute https://host/path?query strings, so a
+    # partition is enough; urlsplit() would re-validate every query string.
+    host, _, target = url.partition("://")[2].partition("/")
+    target = "/" + target
+    for attempt in range(2):
+        conn = _get_conn(host, fresh=attempt > 0)
+        try:
+            conn.request(method, target, body, headers or {})
+            return conn.getresponse()
+        except (http.client.BadStatusLine, ConnectionError,
+                http.client.ImproperConnectionState):
+            # ImproperConnectionState: an earlier caller failed before
+            # reading its response, leaving the connection mid-exchange.
+            conn.close()
+            if attempt:
+                raise
+
+
+def _read_body(resp):
+    """Read the whole response body.
+
+    When the length is known, read straight into one preallocated buffer
+    instead of letting http.client grow and join chunks.
+    """
+    length = resp.length
+    if not length:
+        return resp.read()
+    buf = bytearray(length)
+    view = memoryview(buf)
+    pos = 0
+    while pos < length:
+        n = resp.readinto(view[pos:])
+        if not n:
+            import http.client
+            raise http.client.IncompleteRead(bytes(buf[:pos]), length - pos)
+        pos += n
+    return buf
+
+
+def _body(resp):
+    """Read the response body, undoing gzip transfer compression."""
+    raw = _read_body(resp)
+    if resp.getheader("Content-Encoding") == "gzip":
+        import gzip
+        raw = gzip.decompress(raw)
+    return raw
+
+
+# Optional on-disk cache of successful responses, enabled by setting
+# GMAPS_CACHE_TTL to a lifetime in seconds. GET requests are cached; POST
+# requests only where the caller opts in.
+def _cache_ttl(warn=True):
+    """GMAPS_CACHE_TTL in seconds; 0 (no cache) if unset or not an integer."""
+    value = os.environ.get("GMAPS_CACHE_TTL") or "0"
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        if warn:
+            print(f"Warning: ignoring GMAPS_CACHE_TTL={value!r} (expected seconds)",
+                  file=sys.stderr)
+        return 0
+
+
+def _cache_path():
+    return (Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "gmaps" / "http.sqlite")
+
+
+_CACHE_TTL = _cache_ttl()
+_CACHE_PATH = _cache_path()
+_CACHE_LOCK = threading.Lock()
+_cache_db = None
+
+
+def _cache_conn():
+    global _cache_db
+    if _cache_db is None:
+        import sqlite3
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _cache_db = sqlite3.connect(_CACHE_PATH, check_same_thread=False)
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(k TEXT PRIMARY KEY, ts INTEGER, ct TEXT, body BLOB)")
+    return _cache_db
+
+
+def _cache_key(method, url, body, fields):
+    import hashlib
+    h = hashlib.blake2b(f"{method} {url}\n".encode())
+    if fields:
+        h.update(fields if isinstance(fields, bytes) else fields.encode())
+    h.update(b"\n")
+    if body:
+        h.update(body)
+    return h.hexdigest()
+
+
+def _cache_get(key):
+    """Return (content_type, body) for a fresh cache entry, else None."""
+    with _CACHE_LOCK:
+        row = _cache_conn().execute(
+            "SELECT ct, body FROM cache WHERE k = ? AND ts > ?",
+            (key, int(time.time()) - _CACHE_TTL)).fetchone()
+    return row
+
+
+def _cache_put(key, ct, body):
+    with _CACHE_LOCK:
+        db = _cache_conn()
+        with db:
+            db.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                       (key, int(time.time()), ct, body))
+
+
+def _cache_put_file(key, ct, path):
+    """_cache_put() for a body saved at path, copied in blocks.
+
+    Needs incremental blob I/O (Python 3.11+); older versions don't cache
+    downloads rather than reading the whole file back into memory.
+    """
+    with _CACHE_LOCK:
+        db = _cache_conn()
+        if not hasattr(db, "blobopen"):
+            return
+        with db, open(path, "rb") as f:
+            cur = db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, zeroblob(?))",
+                (key, int(time.time()), ct, os.fstat(f.fileno()).st_size))
+            with db.blobopen("cache", "body", cur.lastrowid) as blob:
+                while chunk := f.read(_BLOCKSIZE):
+                    blob.write(chunk)
+
+
+def _decode(ct, raw):
+    if "json" in ct:
+        return _loads(raw)
+    return raw
+
+
+# The legacy web-service APIs (geocode, elevation, timezone) report errors
+# such as OVER_QUERY_LIMIT or REQUEST_DENIED with HTTP 200 and a "status"
+# field; only real answers may be cached.
+_CACHEABLE_STATUSES = (None, "OK", "ZERO_RESULTS")
+
+
+def _cacheable(data):
+    return not isinstance(data, dict) or data.get("status") in _CACHEABLE_STATUSES
+
+
+def _prepare(body, headers):
+    """Return the encoded request body and the full header dict."""
+    hdrs = {"User-Agent": "gmaps-cli/1.0", "Accept-Encoding": "gzip"}
+    if headers:
+        hdrs.update(headers)
+    if body is not None:
+        if isinstance(body, dict):
+            body = _encode(body)
+            hdrs.setdefault("Content-Type", "application/json")
+        elif isinstance(body, str):
+            body = body.encode()
+    return body, hdrs
+
+
+def _lookup_key(method, url, body, hdrs, cache):
+    """Return the cache key for a request, or None if it is not cached."""
+    if cache is None:
+        cache = method == "GET"
+    if not cache or _CACHE_TTL <= 0:
+        return None
+    return _cache_key(method, url, body, hdrs.get("X-Goog-FieldMask"))
+
+
+_MAX_REDIRECTS = 10  # same limit as urllib
+
+
+class ApiError(Exception):
+    """An HTTP error response; main() prints it and exits with status 1."""
+
+    def __init__(self, status, body):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+
+    def __str__(self):
+        if _RAW_ERRORS:
+            err = self.body.decode(errors="replace")
+        else:
+            err = _pretty_json(self.body)
+        return f"HTTP {self.status} Error:\n{err}"
+
+
+def _open(url, method, body, hdrs):
+    """Send a request and return the successful response, body unread.
+
+    Redirects are followed as urllib does: 301/302/303 are re-issued as a
+    GET without a body, 307/308 repeat the request unchanged. On an HTTP
+    error ApiError is raised; after too many redirects the error is
+    printed and the process exits.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        resp = _send(method, url, body, hdrs)
+        location = resp.getheader("Location")
+        if resp.status not in (301, 302, 303, 307, 308) or not location:
+            break
+        resp.read()
+        url = urllib.parse.urljoin(url, location)
+        if resp.status in (301, 302, 303) and method != "HEAD":
+            method, body = "GET", None
+            hdrs = {k: v for k, v in hdrs.items() if k != "Content-Type"}
+    else:
+        print(f"Error: too many redirects (more than {_MAX_REDIRECTS}), last to {url}",
+              file=sys.stderr)
+        sys.exit(1)
+    if resp.status >= 400:
+        raise ApiError(resp.status, bytes(_body(resp)))
+    return resp
+
+
+def _request(url, method="GET", body=None, headers=None, cache=None):
+    body, hdrs = _prepare(body, headers)
+    key = _lookup_key(method, url, body, hdrs, cache)
+    if key is not None:
+        hit = _cache_get(key)
+        if hit is not None:
+            return _decode(*hit)
+    resp = _open(url, method, body, hdrs)
+    raw = _body(resp)
+    ct = resp.getheader("Content-Type", "")
+    data = _decode(ct, raw)
+    if key is not None and _cacheable(data):
+        _cache_put(key, ct, raw)
+    return data
+
+
+def _request_to_file(url, output_path):
+    """GET url, streaming a binary body straight to output_path.
+
+    Returns None once the file is written, or the decoded body when the
+    API answers with JSON instead.
+    """
+    body, hdrs = _prepare(None, None)
+    key = _lookup_key("GET", url, body, hdrs, None)
+    hit = _cache_get(key) if key is not None else None
+    if hit is not None:
+        ct, raw = hit
+        if "json" in ct:
+            return _loads(raw)
+        Path(output_path).write_bytes(raw)
+        return None
+    resp = _open(url, "GET", body, hdrs)
+    ct = resp.getheader("Content-Type", "")
+    if "json" in ct:
+        raw = _body(resp)
+        data = _loads(raw)
+        if key is not None and _cacheable(data):
+            _cache_put(key, ct, raw)
+        return data
+    tmp = f"{output_path}.part"
+    try:
+        with open(tmp, "wb") as f:
+            _copy_body(resp, f)
+        os.replace(tmp, output_path)  # never leave a partial file in place
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if key is not None:
+        _cache_put_file(key, ct, output_path)
+    return None
+
+
+def _copy_body(resp, f):
+    """Copy the response body to file f in blocks, undoing gzip.
+
+    Like _read_body(), raise IncompleteRead if the server sends less than
+    its Content-Length (read(amt) just returns b"" when it closes early).
+    """
+    import shutil
+    if resp.getheader("Content-Encoding") == "gzip":
+        import gzip
+        shutil.copyfileobj(gzip.GzipFile(fileobj=resp), f, _BLOCKSIZE)
+        return
+    length = resp.length
+    pos = 0
+    while chunk := resp.read(_BLOCKSIZE):
+        f.write(chunk)
+        pos += len(chunk)
+    if length is not None and pos < length:
+        import http.client
+        raise http.client.IncompleteRead(b"", length - pos)
+
+
+def _qs(params):
+    """Encode a flat dict of scalar params, skipping None values.
+
+    None of these APIs take repeated keys, so this skips urlencode()'s
+    per-value sequence handling.
+    """
+    quote = urllib.parse.quote_plus
+    return "&".join(f"{quote(k)}={quote(str(v))}"
+                    for k, v in params.items() if v is not None)
+
+
+def _with_key(base_url, params=None):
+    """Return base_url with params and the API key as its query string."""
+    _key()
+    qs = _qs(params) if params else ""
+    return f"{base_url}?{qs}&{_KEY_QS}" if qs else f"{base_url}?{_KEY_QS}"
+
+
+def api_get(base_url, params=None):
+    return _request(_with_key(base_url, params))
+
+
+def api_post(base_url, data, extra_headers=None, use_key_param=True):
+    url = _with_key(base_url) if use_key_param else base_url
+    hdrs = {}
+    if extra_headers:
+        hdrs.update(extra_headers)
+    return _request(url, method="POST", body=data, headers=hdrs)
+
+
+def api_get_fieldmask(base_url, params=None, fields=None):
+    """GET with X-Goog-FieldMask header (for new Google APIs).
+
+    fields may be str or pre-encoded bytes.
+    """
+    hdrs = {}
+    if fields:
+        hdrs["X-Goog-FieldMask"] = fields
+    return _request(_with_key(base_url, params), headers=hdrs)
+
+
+def api_post_fieldmask(base_url, data, fields=None, cache=False):
+    """POST with X-Goog-FieldMask header (for new Google APIs).
+
+    Pass cache=True for lookups whose results are safe to reuse under
+    GMAPS_CACHE_TTL.
+    """
+    hdrs = {}
+    if fields:
+        hdrs["X-Goog-FieldMask"] = fields
+    return _request(_with_key(base_url), method="POST", body=data,
+                    headers=hdrs, cache=cache)
+
+
+def download_file(url, params, output_path):
+    data = _request_to_file(_with_key(url, params), output_path)
+    if data is None:
+        return {"saved": str(output_path),
+                "size_bytes": os.path.getsize(output_path)}
+    return data
+
+
+BATCH_WORKERS = 16
+
+
+def run_batch(path, fn):
+    """Apply fn to each non-blank line of path concurrently, keeping order.
+
+    A line that fails gets {"input": line, "error": ...} in its slot, so
+    one bad line or rate-limited request doesn't discard the others.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def one(line):
+        try:
+            return fn(line)
+        except ApiError as e:
+            try:
+                body = _loads(e.body)
+            except ValueError:
+                body = e.body.decode(errors="replace")
+            return {"input": line, "error": {"status": e.status, "body": body}}
+        except SystemExit:  # already reported on stderr
+            return {"input": line, "error": "request failed"}
+        except Exception as e:
+            return {"input": line, "error": f"{type(e).__name__}: {e}"}
+
+    require(os.path.isfile(path), f"batch file not found: {path}")
+    lines = [line.strip() for line in Path(path).read_text().splitlines()
+             if line.strip()]
+    _key()  # a missing key fails once here rather than on every line
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as pool:
+        return list(pool.map(one, lines))
+
+
+def require(value, message):
+    if not value:
+        print(f"Error: {message}", file=sys.stderr)
+        sys.exit(1)
+
+
+def out(data):
+    """Print JSON result."""
+    if isinstance(data, (bytes, bytearray)):
+        print(f"(binary data, {len(data)} bytes)")
+    else:
+        _print_json(data)
+
+
+def out_batch(results):
+    """Print run_batch() results; exit 1 if any line failed."""
+    out(results)
+    if any(isinstance(r, dict) and "error" in r for r in results):
+        sys.exit(1)
+
+
+# ---------------------------------------------------------------------------
+# 1. GEOCODING
+# ---------------------------------------------------------------------------
+
+def cmd_geocode(args):
+    """Forward geocode: address -> coordinates."""
+    # Read the optional filters off args once, not once per --batch line.
+    d = vars(args)
+    extra = {k: d[k] for k in ("bounds", "region", "components", "language")
+             if d[k]}
+
+    def geocode(address):
+        return api_get("https://maps.googleapis.com/maps/api/geocode/json",
+                       {"address": address, **extra})
+
+    if args.batch:
+        out_batch(run_batch(args.batch, geocode))
+    else:
+        require(args.address, "address or --batch FILE is required")
+        out(geocode(args.address))
+
+
+def cmd_reverse_geocode(args):
+    """Reverse geocode: coordinates -> address."""
+    d = vars(args)
+    extra = {k: d[k] for k in ("result_type", "location_type", "language")
+             if d[k]}
+
+    def reverse_geocode(latlng):
+        return api_get("https://maps.googleapis.com/maps/api/geocode/json",
+                       {"latlng": latlng, **extra})
+
+    if args.batch:
+        out_batch(run_batch(args.batch, reverse_geocode))
+    else:
+        require(args.lat is not None and args.lng is not None,
+                "lat lng or --batch FILE is required")
+        out(reverse_geocode(f"{args.lat},{args.lng}"))
+
+
+# ---------------------------------------------------------------------------
+# 2. ROUTES (new API)
+# ---------------------------------------------------------------------------
+
+# Field masks are sent as header values; bytes go to the wire as-is.
+DIRECTIONS_FIELDS = b"routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline,routes.legs,routes.description,routes.warnings,routes.travelAdvisory"
+MATRIX_FIELDS = b"originIndex,destinationIndex,duration,distanceMeters,status,condition"
+
+_TRAVEL_MODES = {"driving": "DRIVE", "walking": "WALK", "bicycling": "BICYCLE",
+                 "transit": "TRANSIT", "two_wheeler": "TWO_WHEELER"}
+_ROUTE_MODIFIERS = (("avoidTolls", "avoid_tolls"),
+                    ("avoidHighways", "avoid_highways"),
+                    ("avoidFerries", "avoid_ferries"))
+
+# Encoded polylines use only the characters "?" (63) to "~" (126).
+_POLYLINE_INVALID = re.compile(r"[^?-~]")
+
+
+def decode_polyline(encoded):
+    """Decode a Google encoded polyline into [[lat, lng], ...].
+
+    Raises ValueError for characters outside "?".."~" and for input that
+    ends partway through a value.
+    """
+    bad = _POLYLINE_INVALID.search(encoded)
+    if bad:
+        raise ValueError(f"invalid character {bad.group()!r} at position "
+                         f"{bad.start()} in encoded polyline")
+    coords = []
+    index = lat = lng = 0
+    n = len(encoded)
+    try:
+        while index < n:
+            deltas = []
+            for _ in range(2):
+                result = shift = 0
+                while True:
+                    b = ord(encoded[index]) - 63
+                    index += 1
+                    result |= (b & 0x1F) << shift
+                    shift += 5
+                    if b < 0x20:
+                        break
+                deltas.append(~(result >> 1) if result & 1 else result >> 1)
+            lat += deltas[0]
+            lng += deltas[1]
+            coords.append([lat / 1e5, lng / 1e5])
+    except IndexError:
+        raise ValueError("truncated encoded polyline") from None
+    return coords
+
+
+def cmd_directions(args):
+    """Compute routes between origin and destination."""
+    d = vars(args)
+    body = {
+        "origin": {"address": d["origin"]},
+        "destination": {"address": d["destination"]},
+        "travelMode": _TRAVEL_MODES.get(d["mode"], "DRIVE"),
+        "computeAlternativeRoutes": d["alternatives"],
+        "languageCode": d["language"] or "en",
+    }
+    if d["departure_time"]:
+        body["departureTime"] = d["departure_time"]
+    modifiers = {flag: True for flag, attr in _ROUTE_MODIFIERS if d[attr]}
+    if modifiers:
+        body["routeModifiers"] = modifiers
+    if d["waypoints"]:
+        body["intermediates"] = [{"address": w} for w in d["waypoints"]]
+    if d["units"] == "imperial":
+        body["units"] = "IMPERIAL"
+
+    result = api_post_fieldmask(
+        "https://routes.googleapis.com/directions/v2:computeRoutes",
+        body, fields=DIRECTIONS_FIELDS)
+    if d["decode"]:
+        for route in result.get("routes", []):
+            polyline = route.get("polyline", {})
+            if "encodedPolyline" in polyline:
+                polyline["points"] = decode_polyline(polyline["encodedPolyline"])
+    out(result)
+
+
+def cmd_distance_matrix(args):
+    """Compute distance/duration matrix between origins and destinations."""
+    body = {
+        "origins": [{"waypoint": {"address": o}} for o in args.origins],
+        "destinations": [{"waypoint": {"address": d}} for d in args.destinations],
+        "travelMode": args.mode.upper() if args.mode else "DRIVE",
+    }
+    out(api_post_fieldmask(
+        "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix",
+        body, fields=MATRIX_FIELDS, cache=True))
+
+
+# ---------------------------------------------------------------------------
+# 3. PLACES (new API)
+# ---------------------------------------------------------------------------
+
+PLACES_FIELDS = b"places.id,places.displayName,places.formattedAddress,places.rating,places.userRatingCount,places.types,places.nationalPhoneNumber,places.websiteUri,places.regularOpeningHours,places.priceLevel,places.editorialSummary,places.location"
+PLACE_DETAILS_FIELDS = b"id,displayName,formattedAddress,rating,userRatingCount,types,nationalPhoneNumber,internationalPhoneNumber,websiteUri,regularOpeningHours,priceLevel,editorialSummary,reviews,photos,location,adrFormatAddress,businessStatus,googleMapsUri"
+
+def cmd_places_search(args):
+    """Search for places by text query."""
+    body = {"textQuery": args.query}
+    if args.location:
+        lat, lng = [float(x) for x in args.location.split(",")]
+        body["locationBias"] = {
+            "circle": {"center": {"latitude": lat, "longitude": lng},
+                       "radius": float(args.radius or 5000)}}
+    if args.type:
+        body["includedType"] = args.type
+    if args.min_rating:
+        body["minRating"] = float(args.min_rating)
+    if args.open_now:
+        body["openNow"] = True
+    if args.language:
+        body["languageCode"] = args.language
+    if args.max_results:
+        body["maxResultCount"] = int(args.max_results)
+    out(api_post_fieldmask(
+        "https://places.googleapis.com/v1/places:searchText",
+        body, fields=args.fields or PLACES_FIELDS, cache=True))
+
+
+def cmd_places_nearby(args):
+    """Find places near a location."""
+    body = {
+        "locationRestriction": {
+            "circle": {
+                "center": {"latitude": float(args.lat), "longitude": float(args.lng)},
+                "radius": float(args.radius or 500)}},
+        "maxResultCount": int(args.max_results or 20),
+    }
+    if args.type:
+        body["includedTypes"] = [args.type]
+    if args.language:
+        body["languageCode"] = args.language
+    out(api_post_fieldmask(
+        "https://places.googleapis.com/v1/places:searchNearby",
+        body, fields=args.fields or PLACES_FIELDS))
+
+
+def cmd_place_details(args):
+    """Get details for a specific place by ID."""
+    out(api_get_fieldmask(
+        f"https://places.googleapis.com/v1/places/{args.place_id}",
+        {}, fields=args.fields or PLACE_DETAILS_FIELDS))
+
+
+def cmd_autocomplete(args):
+    """Get place autocomplete suggestions."""
+    body = {"input": args.input}
+    if args.location:
+        lat, lng = [float(x) for x in args.location.split(",")]
+        body["locationBias"] = {
+            "circle": {"center": {"latitude": lat, "longitude": lng},
+                       "radius": float(args.radius or 5000)}}
+    if args.language:
+        body["languageCode"] = args.language
+    if args.region:
+        body["regionCode"] = args.region
+    if args.types:
+        body["includedPrimaryTypes"] = args.types
+    out(api_post(
+        "https://places.googleapis.com/v1/places:autocomplete", body))
+
+
+def cmd_place_photo(args):
+    """Download a place photo."""
+    params = {
+        "maxHeightPx": args.max_height or 400,
+        "maxWidthPx": args.max_width or 400,
+        "skipHttpRedirect": "true",
+    }
+    result = api_get(
+        f"https://places.googleapis.com/v1/{args.photo_ref}/media", params)
+    out(result)
+
+
+# ---------------------------------------------------------------------------
+# 4. ELEVATION
+# ---------------------------------------------------------------------------
+
+def cmd_elevation(args):
+    """Get elevation for coordinates."""
+    def elevation(locations):
+        return api_get("https://maps.googleapis.com/maps/api/elevation/json",
+                       {"locations": locations})
+
+    if args.batch:
+        out_batch(run_batch(args.batch, elevation))
+    elif args.path:
+        params = {"path": args.path, "samples": args.samples or 10}
+        out(api_get("https://maps.googleapis.com/maps/api/elevation/json", params))
+    else:
+        out(elevation(args.locations or f"{args.lat},{args.lng}"))
+
+
+# ---------------------------------------------------------------------------
+# 5. TIMEZONE
+# ---------------------------------------------------------------------------
+
+def cmd_timezone(args):
+    """Get timezone for coordinates."""
+    extra = {"timestamp": args.timestamp or str(int(time.time()))}
+    if args.language:
+        extra["language"] = args.language
+
+    def timezone(location):
+        return api_get("https://maps.googleapis.com/maps/api/timezone/json",
+                       {"location": location, **extra})
+
+    if args.batch:
+        out_batch(run_batch(args.batch, timezone))
+    else:
+        require(args.lat is not None and args.lng is not None,
+                "lat lng or --batch FILE is required")
+        out(timezone(f"{args.lat},{args.lng}"))
+
+
+# ---------------------------------------------------------------------------
+# 6. AIR QUALITY
+# ---------------------------------------------------------------------------
+
+def cmd_air_quality(args):
+    """Get current air quality conditions."""
+    body = {
+        "location": {"latitude": float(args.lat), "longitude": float(args.lng)},
+    }
+    if args.language:
+        body["languageCode"] = args.language
+    extras = []
+    if args.health:
+        extras.append("HEALTH_RECOMMENDATIONS")
+    if args.pollutants:
+        extras.append("DOMINANT_POLLUTANT_CONCENTRATION")
+        extras.append("POLLUTANT_CONCENTRATION")
+    if extras:
+        body["extraComputations"] = extras
+    out(api_post(
+        "https://airquality.googleapis.com/v1/currentConditions:lookup", body))
+
+
+def cmd_air_quality_history(args):
+    """Get historical air quality data."""
+    body = {
+        "location": {"latitude": float(args.lat), "longitude": float(args.lng)},
+        "hours": int(args.hours or 24),
+    }
+    if args.language:
+        body["languageCode"] = args.language
+    out(api_post(
+        "https://airquality.googleapis.com/v1/history:lookup", body))
+
+
+def cmd_air_quality_forecast(args):
+    """Get air quality forecast."""
+    body = {
+        "location": {"latitude": float(args.lat), "longitude": float(args.lng)},
+    }
+    if args.language:
+        body["languageCode"] = args.language
+    out(api_post(
+        "https://airquality.googleapis.com/v1/forecast:lookup", body))
+
+
+# ---------------------------------------------------------------------------
+# 7. POLLEN
+# ---------------------------------------------------------------------------
+
+def cmd_pollen(args):
+    """Get pollen forecast."""
+    params = {
+        "location.latitude": args.lat,
+        "location.longitude": args.lng,
+        "days": args.days or 3,
+    }
+    if args.language:
+        params["languageCode"] = args.language
+    out(api_get("https://pollen.googleapis.com/v1/forecast:lookup", params))
+
+
+# ---------------------------------------------------------------------------
+# 8. SOLAR
+# ---------------------------------------------------------------------------
+
+def cmd_solar(args):
+    """Get solar potential for a building."""
+    params = {
+        "location.latitude": args.lat,
+        "location.longitude": args.lng,
+    }
+    if args.quality:
+        params["requiredQuality"] = args.quality
+    out(api_get("https://solar.googleapis.com/v1/buildingInsights:findClosest", params))
+
+
+def cmd_solar_layers(args):
+    """Get solar data layers (DSM, flux, etc.)."""
+    params = {
+        "location.latitude": args.lat,
+        "location.longitude": args.lng,
+        "radiusMeters": args.radius or 50,
+    }
+    if args.quality:
+        params["requiredQuality"] = args.quality
+    if args.pixel_size:
+        params["pixelSizeMeters"] = args.pixel_size
+    out(api_get("https://solar.googleapis.com/v1/dataLayers:get", params))
+
+
+# ---------------------------------------------------------------------------
+# 9. WEATHER
+# ---------------------------------------------------------------------------
+
+def cmd_weather(args):
+    """Get weather data (current, forecast, history)."""
+    base = "https://weather.googleapis.com/v1"
+    params = {
+        "location.latitude": args.lat,
+        "location.longitude": args.lng,
+    }
+    if args.language:
+        params["languageCode"] = args.language
+
+    if args.mode == "current":
+        url = f"{base}/currentConditions:lookup"
+    elif args.mode == "hourly":
+        url = f"{base}/forecast/hours"
+        if args.hours:
+            params["forecastHours"] = args.hours
+    elif args.mode == "daily":
+        url = f"{base}/forecast/days"
+        if args.days:
+            params["forecastDays"] = args.days
+    elif args.mode == "history":
+        url = f"{base}/history/hours"
+        if args.hours:
+            params["hours"] = args.hours
+    else:
+        url = f"{base}/currentConditions:lookup"
+
+    out(api_get(url, params))
+
+
+# ---------------------------------------------------------------------------
+# 10. ADDRESS VALIDATION
+# ---------------------------------------------------------------------------
+
+def cmd_validate_address(args):
+    """Validate a postal address."""
+    body = {
+        "address": {
+            "addressLines": [args.address],
+        },
+    }
+    if args.region:
+        body["address"]["regionCode"] = args.region
+    if args.locality:
+        body["address"]["locality"] = args.locality
+    if args.enable_usps:
+        body["enableUspsCass"] = True
+    out(api_post(
+        "https://addressvalidation.googleapis.com/v1:validateAddress", body))
+
+
+# ---------------------------------------------------------------------------
+# 11. ROADS
+# ---------------------------------------------------------------------------
+
+def cmd_snap_roads(args):
+    """Snap GPS points to nearest roads."""
+    path = args.path
+    if args.decode:
+        try:
+            points = decode_polyline(path)
+        except ValueError as e:
+            require(False, f"--decode: {e}")
+        path = "|".join(f"{lat},{lng}" for lat, lng in points)
+    params = {
+        "path": path,
+    }
+    if args.interpolate:
+        params["interpolate"] = "true"
+    out(api_get("https://roads.googleapis.com/v1/snapToRoads", params))
+
+
+def cmd_nearest_roads(args):
+    """Find nearest road segments."""
+    params = {"points": args.points}
+    out(api_get("https://roads.googleapis.com/v1/nearestRoads", params))
+
+
+# ---------------------------------------------------------------------------
+# 12. STREET VIEW
+# ---------------------------------------------------------------------------
+
+def cmd_streetview(args):
+    """Download a Street View static image."""
+    params = {
+        "size": args.size or "600x400",
+        "location": f"{args.lat},{args.lng}" if args.lat else args.location,
+    }
+    if args.heading is not None:
+        params["heading"] = args.heading
+    if args.pitch is not None:
+        params["pitch"] = args.pitch
+    if args.fov is not None:
+        params["fov"] = args.fov
+    if args.pano:
+        params["pano"] = args.pano
+        del params["location"]
+    output = args.output or "streetview.jpg"
+    result = download_file(
+        "https://maps.googleapis.com/maps/api/streetview",
+        params, output)
+    out(result)
+
+
+# ---------------------------------------------------------------------------
+# 13. STATIC MAP
+# ---------------------------------------------------------------------------
+
+def cmd_static_map(args):
+    """Download a static map image."""
+    params = {
+        "center": f"{args.lat},{args.lng}" if args.lat else args.center,
+        "zoom": args.zoom or 14,
+        "size": args.size or "600x400",
+        "maptype": args.maptype or "roadmap",
+        "format": args.format or "png",
+    }
+    if args.markers:
+        params["markers"] = args.markers
+    if args.path_line:
+        params["path"] = args.path_line
+    if args.style:
+        params["style"] = args.style
+    if args.scale:
+        params["scale"] = args.scale
+    output = args.output or f"map.{args.format or 'png'}"
+    result = download_file(
+        "https://maps.googleapis.com/maps/api/staticmap",
+        params, output)
+    out(result)
+
+
+# ---------------------------------------------------------------------------
+# 14. GEOLOCATION
+# ---------------------------------------------------------------------------
+
+def _wifi_ap(parts):
+    ap = {"macAddress": parts[0]}
+    if len(parts) > 1:
+        ap["signalStrength"] = int(parts[1])
+    return ap
+
+
+def _cell_tower(parts):
+    return {
+        "cellId": int(parts[0]),
+        "locationAreaCode": int(parts[1]) if len(parts) > 1 else 0,
+        "mobileCountryCode": int(parts[2]) if len(parts) > 2 else 0,
+        "mobileNetworkCode": int(parts[3]) if len(parts) > 3 else 0,
+    }
+
+
+def _read_rows(path):
+    """Read non-blank, non-comment CSV rows from path in one pass."""
+    import csv
+    with open(path, newline="") as f:
+        return [row for row in csv.reader(f)
+                if row and not row[0].lstrip().startswith("#")]
+
+
+def cmd_geolocation(args):
+    """Geolocate from WiFi access points or cell towers."""
+    body = {}
+    if args.consider_ip is not None:
+        body["considerIp"] = args.consider_ip
+    wifi = [w.split(",") for w in args.wifi or ()]
+    if args.wifi_file:
+        wifi += _read_rows(args.wifi_file)
+    if wifi:
+        body["wifiAccessPoints"] = [_wifi_ap(parts) for parts in wifi]
+    cells = [c.split(",") for c in args.cell or ()]
+    if args.cell_file:
+        cells += _read_rows(args.cell_file)
+    if cells:
+        body["cellTowers"] = [_cell_tower(parts) for parts in cells]
+    out(api_post("https://www.googleapis.com/geolocation/v1/geolocate", body))
+
+
+# ---------------------------------------------------------------------------
+# 15. AERIAL VIEW
+# ---------------------------------------------------------------------------
+
+def cmd_aerial_view(args):
+    """Get aerial view video for a US address."""
+    if args.action == "check":
+        params = {"address": args.address}
+        out(api_get(
+            "https://aerialview.googleapis.com/v1/videos:lookupVideoMetadata",
+            params))
+    elif args.action == "render":
+        body = {"address": args.address}
+        out(api_post(
+            "https://aerialview.googleapis.com/v1/videos:renderVideo", body))
+    elif args.action == "get":
+        params = {}
+        if args.video_id:
+            params["videoId"] = args.video_id
+        elif args.address:
+            params["address"] = args.address
+        out(api_get(
+            "https://aerialview.googleapis.com/v1/videos:lookupVideo", params))
+
+
+# ---------------------------------------------------------------------------
+# 16. ROUTE OPTIMIZATION
+# ---------------------------------------------------------------------------
+
+def cmd_route_optimize(args):
+    """Optimize vehicle routes (requires JSON input file)."""
+    input_data = _loads(Path(args.input).read_bytes())
+    project = args.project or "default"
+    out(api_post(
+        f"https://routeoptimization.googleapis.com/v1/projects/{project}:optimizeTours",
+        input_data))
+
+
+# ---------------------------------------------------------------------------
+# 17. PLACES AGGREGATE (Insights)
+# ---------------------------------------------------------------------------
+
+def cmd_places_aggregate(args):
+    """Get aggregate place insights for an area."""
+    body = {
+        "insights": [args.insight or "INSIGHT_COUNT"],
+        "filter": {},
+    }
+    if args.location:
+        lat, lng = [float(x) for x in args.location.split(",")]
+        body["filter"]["locationFilter"] = {
+            "circle": {
+                "latLng": {"latitude": lat, "longitude": lng},
+                "radius": float(args.radius or 5000)}}
+    if args.type:
+        body["filter"]["typeFilter"] = {"includedTypes": [args.type]}
+    if args.min_rating:
+        body["filter"]["ratingFilter"] = {"minRating": float(args.min_rating)}
+    if args.price_levels:
+        body["filter"]["priceLevelFilter"] = {
+            "priceLevels": args.price_levels}
+    out(api_post(
+        "https://areainsights.googleapis.com/v1:computeInsights", body))
+
+
+# ---------------------------------------------------------------------------
+# 18. MAP EMBED URL (free, no API call - just generates URL)
+# ---------------------------------------------------------------------------
+
+def cmd_embed_url(args):
+    """Generate a Google Maps Embed URL (free, unlimited)."""
+    mode = args.mode or "place"
+    params = {"key": _key()}
+    if mode == "place":
+        params["q"] = args.query
+    elif mode == "directions":
+        params["origin"] = args.origin or ""
+        params["destination"] = args.destination or ""
+        if args.waypoints_str:
+            params["waypoints"] = args.waypoints_str
+    elif mode == "search":
+        params["q"] = args.query
+    elif mode == "view":
+        params["center"] = f"{args.lat},{args.lng}" if args.lat else args.center
+        params["zoom"] = args.zoom or 14
+    elif mode == "streetview":
+        params["location"] = f"{args.lat},{args.lng}" if args.lat else args.location
+        if args.heading is not None:
+            params["heading"] = args.heading
+
+    qs = _qs(params)
+    url = f"https://www.google.com/maps/embed/v1/{mode}?{qs}"
+    out({"embed_url": url, "mode": mode})
+
+
+# ---------------------------------------------------------------------------
+# 19. DAEMON (optional warm process for back-to-back invocations)
+# ---------------------------------------------------------------------------
+# With GMAPS_DAEMON=1, main() sends its argv and working directory to a
+# running daemon over a Unix socket and replays the captured output, so
+# repeated calls skip interpreter startup and reuse open HTTPS connections.
+# Requests are handled one at a time.
+
+def _daemon_socket_path():
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        # A directory of our own, so no other user can put a socket at the path.
+        runtime_dir = os.path.join(os.environ.get("TMPDIR") or "/tmp",
+                                   f"gmaps-{os.getuid()}")
+        try:
+            os.mkdir(runtime_dir, 0o700)
+        except FileExistsError:
+            pass
+    return os.path.join(runtime_dir, "gmaps.sock")
+
+
+def _is_private(path):
+    """True if path is ours and, for a directory, closed to other users."""
+    import stat
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if st.st_uid != os.getuid():
+        return False
+    return not stat.S_ISDIR(st.st_mode) or not st.st_mode & 0o077
+
+
+def _daemon_connect():
+    """Return a socket connected to the daemon, or None if none is listening.
+
+    A socket that another user could have created is never connected to:
+    the request carries the command line and working directory, and the
+    reply is printed as the command's output.
+    """
+    import socket
+    path = _daemon_socket_path()
+    if not (_is_private(os.path.dirname(path)) and _is_private(path)):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _daemon_request(sock, request):
+    """Send one request and return (exit code, stdout bytes, stderr bytes)."""
+    import socket
+    sock.sendall(_encode(request))
+    sock.shutdown(socket.SHUT_WR)
+    with sock.makefile("rb") as f:
+        head = _loads(f.readline())
+        return head["code"], f.read(head["out"]), f.read(head["err"])
+
+
+def daemon_call(argv):
+    """Run argv in the daemon; return its exit code, or None if it isn't running."""
+    sock = _daemon_connect()
+    if sock is None:
+        return None
+    with sock:
+        try:
+            code, stdout, stderr = _daemon_request(
+                sock, {"argv": argv, "cwd": os.getcwd(),
+                       "env": {k: os.environ.get(k) for k in _DAEMON_ENV}})
+        except (OSError, ValueError, KeyError):
+            print("Error: lost connection to the gmaps daemon", file=sys.stderr)
+            return 1
+    sys.stdout.buffer.write(stdout)
+    sys.stdout.buffer.flush()
+    sys.stderr.buffer.write(stderr)
+    sys.stderr.buffer.flush()
+    return code
+
+
+# Environment variables the client forwards. Settings derived from them (and
+# from the working directory) are re-read by _daemon_configure() per request.
+_DAEMON_ENV = ("GOOGLE_MAPS_API_KEY", "GMAPS_CACHE_TTL", "GMAPS_RAW_ERRORS",
+               "XDG_CACHE_HOME")
+
+
+def _daemon_configure(request):
+    """Adopt the client's working directory and settings for one request."""
+    global _ENV_PATHS, _API_KEY, _KEY_QS, _RAW_ERRORS, _CACHE_TTL, _CACHE_PATH
+    global _cache_db
+    for name, value in request.get("env", {}).items():
+        if name not in _DAEMON_ENV:
+            continue
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    os.chdir(request["cwd"])
+    _ENV_PATHS = _env_paths()
+    load_api_key.cache_clear()
+    _API_KEY = _KEY_QS = None
+    _RAW_ERRORS = bool(os.environ.get("GMAPS_RAW_ERRORS"))
+    _CACHE_TTL = _cache_ttl(warn=False)  # the client has warned already
+    if _cache_path() != _CACHE_PATH:
+        if _cache_db is not None:
+            _cache_db.close()
+            _cache_db = None
+        _CACHE_PATH = _cache_path()
+
+
+def _daemon_run(request):
+    """Run one request's command line here, capturing its output and exit code."""
+    import io
+    import traceback
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    stderr = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    saved = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = stdout, stderr
+    code = 0
+    try:
+        _daemon_configure(request)
+        main(request["argv"])
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout, sys.stderr = saved
+        stdout.flush()
+        stderr.flush()
+        if code:
+            # A failed command may have left a response unread on a pooled
+            # connection that the next request would reuse.
+            _close_pool()
+        else:
+            _prune_pool()
+    return code, stdout.buffer.getvalue(), stderr.buffer.getvalue()
+
+
+def daemon_serve(path):
+    """Serve requests on the Unix socket at path until asked to stop."""
+    import socket
+    try:
+        os.unlink(path)  # stale socket from a daemon that was killed
+    except FileNotFoundError:
+        pass
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o077)  # only this user may connect
+    try:
+        srv.bind(path)
+    finally:
+        os.umask(umask)
+    srv.listen()
+    try:
+        while True:
+            conn, _ = srv.accept()
+            with conn, conn.makefile("rb") as f:
+                try:
+                    request = _loads(f.read())
+                except ValueError:
+                    continue
+                if request.get("stop"):
+                    conn.sendall(b'{"code": 0, "out": 0, "err": 0}\n')
+                    break
+                code, stdout, stderr = _daemon_run(request)
+                head = _encode({"code": code, "out": len(stdout), "err": len(stderr)})
+                try:
+                    conn.sendall(head + b"\n" + stdout + stderr)
+                except OSError:
+                    pass  # client went away
+    finally:
+        srv.close()
+        os.unlink(path)
+
+
+def cmd_daemon(args):
+    """Start, stop or run in the foreground the daemon used by GMAPS_DAEMON=1."""
+    path = _daemon_socket_path()
+    sock = _daemon_connect()
+    if args.action == "stop":
+        require(sock, "gmaps daemon is not running")
+        with sock:
+            _daemon_request(sock, {"stop": True})
+        out({"daemon": "stopped", "socket": path})
+        return
+    if sock is not None:
+        sock.close()
+        require(args.action == "start", f"gmaps daemon is already running on {path}")
+        out({"daemon": "running", "socket": path})
+        return
+    require(_is_private(os.path.dirname(path)),
+            f"{os.path.dirname(path)} must be owned by you and not accessible "
+            "to other users (mode 0700)")
+    if args.action == "run":
+        daemon_serve(path)
+        return
+    import subprocess
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "daemon", "run"],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL, start_new_session=True)
+    for _ in range(100):  # wait up to ~5s for the socket to appear
+        sock = _daemon_connect()
+        if sock is not None or proc.poll() is not None:
+            break
+        time.sleep(0.05)
+    require(sock, "gmaps daemon failed to start")
+    sock.close()
+    out({"daemon": "started", "socket": path, "pid": proc.pid})
+
+
+# ===========================================================================
+# CLI PARSER
+# ===========================================================================
+
+# Argument definitions shared by many commands: (flag, add_argument kwargs).
+_LAT_LNG = (("lat", {"type": float}), ("lng", {"type": float}))
+_LAT_LNG_OPTIONAL = (("lat", {"nargs": "?", "type": float}),
+                     ("lng", {"nargs": "?", "type": float}))
+_LANGUAGE = ("--language", {})
+
+# Shared choices for --mode, --quality, etc.
+_MODES = tuple(_TRAVEL_MODES)
+_UNITS = ("metric", "imperial")
+_QUALITY = ("LOW", "MEDIUM", "HIGH")
+_WEATHER_MODES = ("current", "hourly", "daily", "history")
+_MAPTYPES = ("roadmap", "satellite", "terrain", "hybrid")
+_IMAGE_FORMATS = ("png", "jpg", "gif")
+_EMBED_MODES = ("place", "directions", "search", "view", "streetview")
+
+
+def _pipe_list(value):
+    """argparse type for list options, e.g. --origins "New York|Boston"."""
+    return [item for item in value.split("|") if item]
+
+
+# name -> (handler, arguments). Each argument is a flag plus its
+# add_argument() keyword arguments; build_parser() and parse_fast() both
+# work from this table, and main() builds only the subparser being run.
+# Help text lives in gmaps_help.py and is only loaded to print help.
+COMMANDS = {
+    "geocode": (cmd_geocode, (
+        ("address", {"nargs": "?"}),
+        ("--batch", {"metavar": "FILE"}),
+        ("--bounds", {}),
+        ("--region", {}),
+        ("--components", {}),
+        _LANGUAGE,
+    )),
+    "reverse-geocode": (cmd_reverse_geocode, (
+        *_LAT_LNG_OPTIONAL,
+        ("--batch", {"metavar": "FILE"}),
+        ("--result-type", {}),
+        ("--location-type", {}),
+        _LANGUAGE,
+    )),
+    "directions": (cmd_directions, (
+        ("origin", {}),
+        ("destination", {}),
+        ("--mode", {"default": "driving", "choices": _MODES}),
+        ("--alternatives", {"action": "store_true"}),
+        ("--avoid-tolls", {"action": "store_true"}),
+        ("--avoid-highways", {"action": "store_true"}),
+        ("--avoid-ferries", {"action": "store_true"}),
+        ("--waypoints", {"type": _pipe_list}),
+        ("--departure-time", {}),
+        ("--units", {"choices": _UNITS, "default": "metric"}),
+        _LANGUAGE,
+        ("--decode", {"action": "store_true"}),
+    )),
+    "distance-matrix": (cmd_distance_matrix, (
+        ("--origins", {"type": _pipe_list, "required": True}),
+        ("--destinations", {"type": _pipe_list, "required": True}),
+        ("--mode", {"default": "driving"}),
+    )),
+    "places-search": (cmd_places_search, (
+        ("query", {}),
+        ("--location", {}),
+        ("--radius", {}),
+        ("--type", {}),
+        ("--min-rating", {}),
+        ("--open-now", {"action": "store_true"}),
+        _LANGUAGE,
+        ("--max-results", {}),
+        ("--fields", {}),
+    )),
+    "places-nearby": (cmd_places_nearby, (
+        *_LAT_LNG,
+        ("--radius", {"default": 500}),
+        ("--type", {}),
+        _LANGUAGE,
+        ("--max-results", {}),
+        ("--fields", {}),
+    )),
+    "place-details": (cmd_place_details, (
+        ("place_id", {}),
+        ("--fields", {}),
+    )),
+    "autocomplete": (cmd_autocomplete, (
+        ("input", {}),
+        ("--location", {}),
+        ("--radius", {}),
+        _LANGUAGE,
+        ("--region", {}),
+        ("--types", {"type": _pipe_list}),
+    )),
+    "place-photo": (cmd_place_photo, (
+        ("photo_ref", {}),
+        ("--max-height", {"type": int, "default": 400}),
+        ("--max-width", {"type": int, "default": 400}),
+    )),
+    "elevation": (cmd_elevation, (
+        *_LAT_LNG_OPTIONAL,
+        ("--locations", {}),
+        ("--path", {}),
+        ("--samples", {"type": int}),
+        ("--batch", {"metavar": "FILE"}),
+    )),
+    "timezone": (cmd_timezone, (
+        *_LAT_LNG_OPTIONAL,
+        ("--batch", {"metavar": "FILE"}),
+        ("--timestamp", {}),
+        _LANGUAGE,
+    )),
+    "air-quality": (cmd_air_quality, (
+        *_LAT_LNG,
+        ("--health", {"action": "store_true"}),
+        ("--pollutants", {"action": "store_true"}),
+        _LANGUAGE,
+    )),
+    "air-quality-history": (cmd_air_quality_history, (
+        *_LAT_LNG,
+        ("--hours", {"default": 24}),
+        _LANGUAGE,
+    )),
+    "air-quality-forecast": (cmd_air_quality_forecast, (
+        *_LAT_LNG,
+        _LANGUAGE,
+    )),
+    "pollen": (cmd_pollen, (
+        *_LAT_LNG,
+        ("--days", {"type": int, "default": 3}),
+        _LANGUAGE,
+    )),
+    "solar": (cmd_solar, (
+        *_LAT_LNG,
+        ("--quality", {"choices": _QUALITY}),
+    )),
+    "solar-layers": (cmd_solar_layers, (
+        *_LAT_LNG,
+        ("--radius", {"type": float, "default": 50}),
+        ("--quality", {"choices": _QUALITY}),
+        ("--pixel-size", {"type": float}),
+    )),
+    "weather": (cmd_weather, (
+        *_LAT_LNG,
+        ("--mode", {"default": "current", "choices": _WEATHER_MODES}),
+        ("--hours", {"type": int}),
+        ("--days", {"type": int}),
+        _LANGUAGE,
+    )),
+    "validate-address": (cmd_validate_address, (
+        ("address", {}),
+        ("--region", {}),
+        ("--locality", {}),
+        ("--enable-usps", {"action": "store_true"}),
+    )),
+    "snap-roads": (cmd_snap_roads, (
+        ("path", {}),
+        ("--interpolate", {"action": "store_true"}),
+        ("--decode", {"action": "store_true"}),
+    )),
+    "nearest-roads": (cmd_nearest_roads, (
+        ("points", {}),
+    )),
+    "streetview": (cmd_streetview, (
+        ("--lat", {"type": float}),
+        ("--lng", {"type": float}),
+        ("--location", {}),
+        ("--pano", {}),
+        ("--size", {"default": "600x400"}),
+        ("--heading", {"type": float}),
+        ("--pitch", {"type": float}),
+        ("--fov", {"type": float}),
+        ("--output", {}),
+    )),
+    "static-map": (cmd_static_map, (
+        ("--lat", {"type": float}),
+        ("--lng", {"type": float}),
+        ("--center", {}),
+        ("--zoom", {"type": int, "default": 14}),
+        ("--size", {"default": "600x400"}),
+        ("--maptype", {"default": "roadmap", "choices": _MAPTYPES}),
+        ("--format", {"default": "png", "choices": _IMAGE_FORMATS}),
+        ("--markers", {}),
+        ("--path-line", {}),
+        ("--style", {}),
+        ("--scale", {"type": int, "choices": (1, 2, 4)}),
+        ("--output", {}),
+    )),
+    "geolocation": (cmd_geolocation, (
+        ("--wifi", {"type": _pipe_list}),
+        ("--cell", {"type": _pipe_list}),
+        ("--wifi-file", {}),
+        ("--cell-file", {}),
+        ("--consider-ip", {"type": bool, "default": True}),
+    )),
+    "aerial-view": (cmd_aerial_view, (
+        ("action", {"choices": ("check", "render", "get")}),
+        ("--address", {}),
+        ("--video-id", {}),
+    )),
+    "route-optimize": (cmd_route_optimize, (
+        ("input", {}),
+        ("--project", {}),
+    )),
+    "places-aggregate": (cmd_places_aggregate, (
+        ("--location", {}),
+        ("--radius", {}),
+        ("--type", {}),
+        ("--min-rating", {}),
+        ("--price-levels", {"type": _pipe_list}),
+        ("--insight", {"default": "INSIGHT_COUNT", "choices": ("INSIGHT_COUNT", "INSIGHT_PLACES")}),
+    )),
+    "embed-url": (cmd_embed_url, (
+        ("--mode", {"default": "place", "choices": _EMBED_MODES}),
+        ("--query", {}),
+        ("--origin", {}),
+        ("--destination", {}),
+        ("--waypoints-str", {}),
+        ("--lat", {"type": float}),
+        ("--lng", {"type": float}),
+        ("--center", {}),
+        ("--location", {}),
+        ("--zoom", {"type": int}),
+        ("--heading", {"type": float}),
+    )),
+    "daemon": (cmd_daemon, (
+        ("action", {"choices": ("start", "stop", "run")}),
+    )),
+}
+
+DESCRIPTION = "Google Maps Platform - Universal API Client (20+ APIs)"
+USAGE = "gmaps [-h] [--version] <command> ..."
+
+
+def build_parser(commands=None, with_help=False):
+    """Build the CLI parser with subparsers for commands (default: all).
+
+    Help strings are attached only when with_help is set, as nothing but
+    -h/--help output uses them.
+    """
+    import argparse
+    if with_help:
+        import gmaps_help
+        command_help, argument_help = gmaps_help.COMMANDS, gmaps_help.ARGUMENTS
+    else:
+        command_help = argument_help = {}
+    p = argparse.ArgumentParser(prog="gmaps", description=DESCRIPTION)
+    p.add_argument("--version", action="version", version=f"%(prog)s {VERSION}")
+    sub = p.add_subparsers(dest="command", help="API command")
+    for name in commands or COMMANDS:
+        func, arguments = COMMANDS[name]
+        s = sub.add_parser(name, help=command_help.get(name))
+        for flag, kwargs in arguments:
+            text = argument_help.get(f"{name} {flag}") or argument_help.get(flag)
+            if text:
+                kwargs = {**kwargs, "help": text}
+            s.add_argument(flag, **kwargs)
+        s.set_defaults(func=func)
+    return p
+
+
+# --- Parser cache (opt-in) ---
+
+_PARSER_CACHE = os.environ.get("GMAPS_PARSER_CACHE") == "1"
+
+
+def _parser_cache_path(commands, with_help):
+    import hashlib
+    src = os.path.abspath(__file__)
+    key = repr((tuple(sys.version_info), __name__, src, os.path.getmtime(src),
+                commands, with_help and os.path.getmtime(
+                    os.path.join(os.path.dirname(src), "gmaps_help.py"))))
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return _CACHE_PATH.parent / f"parser-{digest}.pkl"
+
+
+def _persistent_id(obj):
+    # argparse compares against SUPPRESS by identity, which a plain pickle
+    # round trip would lose.
+    import argparse
+    return "SUPPRESS" if obj is argparse.SUPPRESS else None
+
+
+def _persistent_load(pid):
+    import argparse
+    import pickle
+    if pid == "SUPPRESS":
+        return argparse.SUPPRESS
+    raise pickle.UnpicklingError(f"unknown persistent id {pid!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def load_parser(commands=None, with_help=False):
+    """build_parser(), reusing a pickled copy when GMAPS_PARSER_CACHE=1.
+
+    Parsers are also memoized per (commands, with_help), so repeated calls
+    in one process (e.g. the daemon) build each one only once; commands
+    must therefore be a tuple.
+
+    The cache file is keyed on the Python version and the path and mtime of
+    this file (and of gmaps_help.py for help parsers), so editing either
+    invalidates it. Any failure to read or write it just falls back to
+    building the parser.
+    """
+    if not _PARSER_CACHE:
+        return build_parser(commands, with_help)
+    import pickle
+    commands = tuple(commands or COMMANDS)
+    path = _parser_cache_path(commands, with_help)
+    try:
+        with open(path, "rb") as f:
+            unpickler = pickle.Unpickler(f)
+            unpickler.persistent_load = _persistent_load
+            return unpickler.load()
+    except Exception:
+        pass
+    parser = build_parser(commands, with_help)
+    # The default type converter is a local function, which cannot be
+    # pickled; str() is equivalent for the strings argparse passes it.
+    for p in [parser, *parser._subparsers._group_actions[0].choices.values()]:
+        p.register("type", None, str)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = _persistent_id
+            pickler.dump(parser)
+        os.replace(tmp, path)
+    except (OSError, pickle.PicklingError):
+        pass
+    return parser
+
+
+# Same test argparse uses to tell "-74.006" from an option.
+_NEGATIVE_NUMBER_RE = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+def _is_option(token):
+    return token.startswith("-") and not _NEGATIVE_NUMBER_RE.match(token)
+
+
+def _convert(value, kwargs):
+    """Apply an argument's type and choices; raise ValueError if invalid."""
+    try:
+        value = kwargs.get("type", str)(value)
+    except (TypeError, ValueError):
+        raise ValueError(value)
+    if "choices" in kwargs and value not in kwargs["choices"]:
+        raise ValueError(value)
+    return value
+
+
+def parse_fast(name, argv):
+    """Parse a command's arguments without argparse, or return None.
+
+    Covers the forms this CLI uses: positionals, --opt value, --opt=value
+    and store_true flags. Anything else (help, unknown or
+    abbreviated options, invalid or missing values) returns None so that
+    argparse can handle it and report errors.
+    """
+    func, arguments = COMMANDS[name]
+    ns = {"command": name, "func": func}
+    positionals, options, required = [], {}, set()
+    for flag, kwargs in arguments:
+        if not flag.startswith("-"):
+            positionals.append((flag, kwargs))
+            ns[flag] = kwargs.get("default")
+            continue
+        dest = kwargs.get("dest") or flag[2:].replace("-", "_")
+        options[flag] = (dest, kwargs)
+        if kwargs.get("action") == "store_true":
+            ns[dest] = False
+        else:
+            default = kwargs.get("default")
+            if isinstance(default, str) and "type" in kwargs:
+                default = kwargs["type"](default)
+            ns[dest] = default
+        if kwargs.get("required"):
+            required.add(dest)
+
+    values = []
+    i = 0
+    try:
+        while i < len(argv):
+            token = argv[i]
+            i += 1
+            if not _is_option(token):
+                values.append(token)
+                continue
+            flag, eq, value = token.partition("=")
+            if flag not in options:
+                return None
+            dest, kwargs = options[flag]
+            required.discard(dest)
+            if kwargs.get("action") == "store_true":
+                if eq:
+                    return None
+                ns[dest] = True
+            else:
+                if not eq:
+                    if i >= len(argv) or _is_option(argv[i]):
+                        return None
+                    value = argv[i]
+                    i += 1
+                ns[dest] = _convert(value, kwargs)
+        if required or len(values) > len(positionals):
+            return None
+        for n, (dest, kwargs) in enumerate(positionals):
+            if n < len(values):
+                ns[dest] = _convert(values[n], kwargs)
+            elif kwargs.get("nargs") != "?":
+                return None
+    except ValueError:
+        return None
+    return types.SimpleNamespace(**ns)
+
+
+def run_command(args):
+    """Run the parsed command, reporting API errors on stderr."""
+    try:
+        args.func(args)
+    except ApiError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+def _wants_help(argv):
+    """True if argv asks argparse for help (-h, --help or an abbreviation)."""
+    return any(a == "-h" or len(a) > 2 and "--help".startswith(a) for a in argv)
+
+
+def print_help():
+    """Print the top-level help from COMMANDS without building any parser."""
+    import gmaps_help
+    print(f"usage: {USAGE}\n")
+    print(f"{DESCRIPTION}\n")
+    print("commands:")
+    for name in COMMANDS:
+        print(f"  {name:<22}{gmaps_help.COMMANDS[name]}")
+    print("\nRun 'gmaps <command> -h' for a command's options.")
+
+
+_BASH_COMPLETION = """\
+# bash completion for gmaps.py, generated by: gmaps.py --generate-completion bash
+_gmaps() {{
+    local cur=${{COMP_WORDS[COMP_CWORD]}} prev=${{COMP_WORDS[COMP_CWORD-1]}}
+    local words
+    if (( COMP_CWORD == 1 )); then
+        words="{commands} -h --help --version"
+    else
+        case "${{COMP_WORDS[1]}} $prev" in
+{choices}
+        esac
+        if [[ -z $words && $cur == -* ]]; then
+            case "${{COMP_WORDS[1]}}" in
+{options}
+            esac
+        fi
+    fi
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}}
+complete -o default -F _gmaps gmaps.py gmaps
+"""
+
+
+def bash_completion():
+    """Return a static bash completion script generated from COMMANDS.
+
+    Completing from a fixed script means pressing TAB never starts Python.
+    """
+    choices, options = [], []
+    for name, (_, arguments) in COMMANDS.items():
+        flags = ["-h"]
+        for flag, kwargs in arguments:
+            if flag.startswith("-"):
+                flags.append(flag)
+                prev = flag
+            else:
+                prev = name  # a positional with choices follows the command
+            if "choices" in kwargs:
+                words = " ".join(map(str, kwargs["choices"]))
+                choices.append(f'            "{name} {prev}") words="{words}" ;;')
+        options.append(f'                {name}) words="{" ".join(flags)}" ;;')
+    return _BASH_COMPLETION.format(commands=" ".join(COMMANDS),
+                                   choices="\n".join(choices),
+                                   options="\n".join(options))
+
+
+# Never forwarded to the daemon: daemon manages it, and embed-url only
+# formats a URL, so a socket round trip would cost more than running it.
+_LOCAL_COMMANDS = (["daemon"], ["embed-url"])
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+        if os.environ.get("GMAPS_DAEMON") == "1" and argv[:1] not in _LOCAL_COMMANDS:
+            code = daemon_call(argv)
+            if code is not None:
+                sys.exit(code)
+    # Bare usage, top-level help and --version never need argparse, and
+    # most command lines are handled by parse_fast(); "gmaps <command> -h"
+    # and invalid input get the single subparser built below.
+    if not argv:
+        print_help()
+        sys.exit(1)
+    if argv[0] in ("-h", "--help"):
+        print_help()
+        return
+    if argv[0] == "--version":
+        print(f"gmaps {VERSION}")
+        return
+    if argv[0] == "--generate-completion":  # hidden; see completions/
+        require(argv[1:] == ["bash"], "only bash completion is supported")
+        sys.stdout.write(bash_completion())
+        return
+    cmd = argv[0]
+    if cmd in COMMANDS:
+        args = parse_fast(cmd, argv[1:])
+        if args is not None:
+            run_command(args)
+            return
+        parser = load_parser((cmd,), _wants_help(argv))
+    elif not cmd.startswith("-"):
+        # Unknown command: report it without building any subparser.
+        import argparse
+        choices = ", ".join(map(repr, COMMANDS))
+        argparse.ArgumentParser(prog="gmaps", usage=USAGE).error(
+            f"argument command: invalid choice: {cmd!r} (choose from {choices})")
+    else:
+        parser = load_parser(with_help=_wants_help(argv))
+    args = parser.parse_args(argv)
+    if not args.command:
+        print_help()
+        sys.exit(1)
+    run_command(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Help text for the gmaps_cli.py argument parsers.
+
+Only imported by gmaps_cli.py's print_help() and build_parser(with_help=True)
+when help is printed (gmaps.py -h, or <command> -h), so ordinary runs never
+load these strings.
+"""
+
+# command -> one-line description
+COMMANDS = {
+    "geocode": "Forward geocode (address -> coordinates)",
+    "reverse-geocode": "Reverse geocode (coords -> address)",
+    "directions": "Get routes between locations",
+    "distance-matrix": "Distance/duration matrix",
+    "places-search": "Search places by text",
+    "places-nearby": "Find places near a location",
+    "place-details": "Get place details by ID",
+    "autocomplete": "Place autocomplete",
+    "place-photo": "Get place photo URL",
+    "elevation": "Get elevation for coordinates",
+    "timezone": "Get timezone for coordinates",
+    "air-quality": "Current air quality",
+    "air-quality-history": "Historical air quality",
+    "air-quality-forecast": "Air quality forecast",
+    "pollen": "Pollen forecast",
+    "solar": "Building solar potential",
+    "solar-layers": "Solar data layers (DSM, flux)",
+    "weather": "Weather data",
+    "validate-address": "Validate a postal address",
+    "snap-roads": "Snap GPS points to roads",
+    "nearest-roads": "Find nearest road segments",
+    "streetview": "Download Street View image",
+    "static-map": "Download static map image",
+    "geolocation": "Geolocate from WiFi/cell towers",
+    "aerial-view": "Aerial view video (US only)",
+    "route-optimize": "Optimize vehicle routes",
+    "places-aggregate": "Aggregate place insights",
+    "embed-url": "Generate Maps Embed URL (free)",
+    "daemon": "Background process for repeated calls",
+}
+
+# Argument help keyed by "command flag"; bare flags are shared defaults.
+ARGUMENTS = {
+    "lat": "Latitude",
+    "lng": "Longitude",
+    "--language": "Language code",
+    "--radius": "Radius in meters",
+    "geocode address": "Address to geocode",
+    "geocode --batch": "Geocode each line of FILE concurrently",
+    "geocode --bounds": "Bounding box bias (sw_lat,sw_lng|ne_lat,ne_lng)",
+    "geocode --region": "Region bias (ccTLD, e.g. 'us')",
+    "geocode --components": "Component filter (e.g. 'country:US')",
+    "reverse-geocode --batch": "Reverse geocode each lat,lng line of FILE concurrently",
+    "reverse-geocode --result-type": "Filter result types",
+    "reverse-geocode --location-type": "Filter location types",
+    "directions origin": "Starting address",
+    "directions destination": "Destination address",
+    "directions --alternatives": "Compute alternative routes",
+    "directions --waypoints": "Intermediate stops, |-separated",
+    "directions --departure-time": "ISO 8601 departure time",
+    "directions --decode": "Add decoded [lat, lng] points to each route polyline",
+    "distance-matrix --origins": "Origin addresses, |-separated",
+    "distance-matrix --destinations": "Destination addresses, |-separated",
+    "places-search query": "Search query (e.g. 'pizza in NYC')",
+    "places-search --location": "Bias location (lat,lng)",
+    "places-search --radius": "Bias radius in meters",
+    "places-search --type": "Place type filter",
+    "places-search --min-rating": "Minimum rating (1-5)",
+    "places-search --max-results": "Max results (1-20)",
+    "places-search --fields": "Custom field mask",
+    "places-nearby --type": "Place type (e.g. restaurant, cafe)",
+    "places-nearby --max-results": "Max results",
+    "places-nearby --fields": "Custom field mask",
+    "place-details place_id": "Google Place ID",
+    "place-details --fields": "Custom field mask",
+    "autocomplete input": "Text to autocomplete",
+    "autocomplete --location": "Bias location (lat,lng)",
+    "autocomplete --radius": "Bias radius in meters",
+    "autocomplete --region": "Region code",
+    "autocomplete --types": "Type filters, |-separated",
+    "place-photo photo_ref": "Photo resource name (from place details)",
+    "elevation --locations": "Multiple lat,lng pairs separated by |",
+    "elevation --path": "Encoded polyline or pipe-separated coords for path sampling",
+    "elevation --samples": "Number of samples along path",
+    "elevation --batch": "Look up each line of FILE (lat,lng or |-separated pairs) concurrently",
+    "timezone --batch": "Look up each lat,lng line of FILE concurrently",
+    "timezone --timestamp": "Unix timestamp (default: now)",
+    "air-quality --health": "Include health recommendations",
+    "air-quality --pollutants": "Include pollutant details",
+    "air-quality-history --hours": "Hours of history (max 720)",
+    "pollen --days": "Forecast days (1-5)",
+    "solar --quality": "Required imagery quality",
+    "solar-layers --pixel-size": "Pixel size in meters",
+    "weather --hours": "Forecast/history hours",
+    "weather --days": "Forecast days (for daily mode)",
+    "validate-address address": "Address to validate",
+    "validate-address --region": "Region code (e.g. US)",
+    "validate-address --locality": "City/locality",
+    "validate-address --enable-usps": "Enable USPS CASS (US only)",
+    "snap-roads path": "Pipe-separated lat,lng pairs",
+    "snap-roads --interpolate": "Interpolate between points",
+    "snap-roads --decode": "Path is an encoded polyline (e.g. from directions)",
+    "nearest-roads points": "Pipe-separated lat,lng pairs",
+    "streetview --lat": "Latitude",
+    "streetview --lng": "Longitude",
+    "streetview --location": "Address or lat,lng string",
+    "streetview --pano": "Panorama ID (instead of location)",
+    "streetview --size": "Image size WxH",
+    "streetview --heading": "Camera heading (0-360)",
+    "streetview --pitch": "Camera pitch (-90 to 90)",
+    "streetview --fov": "Field of view (10-120)",
+    "streetview --output": "Output file path",
+    "static-map --lat": "Center latitude",
+    "static-map --lng": "Center longitude",
+    "static-map --center": "Center as address or lat,lng",
+    "static-map --zoom": "Zoom level (0-21)",
+    "static-map --size": "Image size WxH",
+    "static-map --markers": "Marker specification",
+    "static-map --path-line": "Path/polyline specification",
+    "static-map --style": "Map style",
+    "static-map --scale": "Image scale",
+    "static-map --output": "Output file path",
+    "geolocation --wifi": "WiFi APs as |-separated MAC,signal pairs",
+    "geolocation --cell": "Cell towers as |-separated cellId,lac,mcc,mnc",
+    "geolocation --wifi-file": "CSV file of MAC,signal rows",
+    "geolocation --cell-file": "CSV file of cellId,lac,mcc,mnc rows",
+    "geolocation --consider-ip": "Use IP as fallback",
+    "aerial-view action": "check metadata, render video, or get video",
+    "aerial-view --address": "US street address",
+    "aerial-view --video-id": "Video ID (for 'get' action)",
+    "route-optimize input": "JSON input file with shipments/vehicles",
+    "route-optimize --project": "GCP project ID",
+    "places-aggregate --location": "Center location (lat,lng)",
+    "places-aggregate --type": "Place type filter",
+    "places-aggregate --min-rating": "Minimum rating",
+    "places-aggregate --price-levels": "Price levels, |-separated (PRICE_LEVEL_FREE, etc.)",
+    "places-aggregate --insight": "Type of insight to return",
+    "embed-url --query": "Place or search query",
+    "embed-url --origin": "Directions origin",
+    "embed-url --destination": "Directions destination",
+    "embed-url --waypoints-str": "Pipe-separated waypoints",
+    "embed-url --lat": "Latitude",
+    "embed-url --lng": "Longitude",
+    "embed-url --center": "Center as lat,lng",
+    "embed-url --location": "Location string",
+    "embed-url --zoom": "Zoom level",
+    "embed-url --heading": "Street View heading",
+    "daemon action": "start in the background, stop, or run in the foreground",
+}